@@ -1,5 +1,8 @@
+import bisect
 import datetime
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
 
 from src.config import BookingConfig
 from src.clients.better_client import get_client
@@ -9,25 +12,24 @@ from src.notifications import send_failure_notification, send_success_notificati
 logger = logging.getLogger(__name__)
 
 
-def parse_time_window(
-    min_slot_time: str, max_slot_time: str | None
-) -> tuple[datetime.time, datetime.time | None]:
-    """Parse time strings into time objects."""
-    min_time = datetime.time.fromisoformat(min_slot_time)
-    max_time = datetime.time.fromisoformat(max_slot_time) if max_slot_time else None
-    return min_time, max_time
-
-
 def filter_slots_by_time_window(
     activity_times: list,
     min_time: datetime.time,
     max_time: datetime.time | None,
 ) -> list:
-    """Filter slots to be within time window."""
-    filtered = [s for s in activity_times if s.start >= min_time]
-    if max_time:
-        filtered = [s for s in filtered if s.end <= max_time]
-    return filtered
+    """Filter slots to be within time window.
+
+    Returns the matching slots ordered by start time.
+    """
+    # The API already returns times in order, so this sort is a linear pass
+    activity_times = sorted(activity_times, key=attrgetter("start"))
+    lo = bisect.bisect_left(activity_times, min_time, key=attrgetter("start"))
+    if not max_time:
+        return activity_times[lo:]
+
+    # A slot starting after max_time cannot end by it
+    hi = bisect.bisect_right(activity_times, max_time, lo=lo, key=attrgetter("start"))
+    return [s for s in activity_times[lo:hi] if s.end <= max_time]
 
 
 def convert_times_to_slots(
@@ -37,9 +39,14 @@ def convert_times_to_slots(
     activity_date: datetime.date,
     activity_times: list,
 ) -> list:
-    """Convert ActivityTime objects to bookable ActivitySlot objects."""
-    slots = []
-    for activity_time in activity_times:
+    """Convert ActivityTime objects to bookable ActivitySlot objects.
+
+    Slot lookups are issued concurrently; results keep the input order.
+    """
+    if not activity_times:
+        return []
+
+    def fetch_slot(activity_time):
         slot_list = client.get_available_slots_for(
             venue=venue,
             activity=activity,
@@ -47,8 +54,10 @@ def convert_times_to_slots(
             start_time=activity_time.start,
             end_time=activity_time.end,
         )
-        slots.append(slot_list[0])
-    return slots
+        return slot_list[0]
+
+    with ThreadPoolExecutor(max_workers=len(activity_times)) as executor:
+        return list(executor.map(fetch_slot, activity_times))
 
 
 def complete_booking(client, slots: list) -> str:
@@ -87,14 +96,15 @@ def find_consecutive_slots(activity_times: list, n_slots: int) -> list | None:
     if len(activity_times) < n_slots:
         return None
 
-    for i in range(len(activity_times) - n_slots + 1):
-        candidate = activity_times[i : i + n_slots]
-        is_consecutive = all(
-            candidate[j].end == candidate[j + 1].start
-            for j in range(len(candidate) - 1)
-        )
-        if is_consecutive:
-            return candidate
+    # Single pass: track the length of the current run of back-to-back slots
+    run_length = 1
+    for i in range(len(activity_times)):
+        if i > 0 and activity_times[i - 1].end == activity_times[i].start:
+            run_length += 1
+        else:
+            run_length = 1
+        if run_length >= n_slots:
+            return activity_times[i - n_slots + 1 : i + 1]
 
     return None
 
@@ -108,13 +118,6 @@ def book_activity_slots(
     logger.info(f"Starting booking job: {name}")
 
     try:
-        min_slot_time = datetime.time.fromisoformat(booking.min_slot_time)
-        max_slot_time = (
-            datetime.time.fromisoformat(booking.max_slot_time)
-            if booking.max_slot_time
-            else None
-        )
-
         client = get_client(username=booking.username, password=booking.password)
 
         activity_times = client.get_available_times_for(
@@ -122,21 +125,25 @@ def book_activity_slots(
             activity=booking.activity,
             activity_date=activity_date,
         )
-        times_str = ", ".join(f"{t.start}-{t.end}" for t in activity_times)
-        logger.info(f"[{name}] Found {len(activity_times)} activity times: {times_str}")
-
-        # Filter by min_slot_time
-        activity_times = [s for s in activity_times if s.start >= min_slot_time]
-
-        # Filter by max_slot_time (slot must end by max_slot_time)
-        if max_slot_time:
-            activity_times = [s for s in activity_times if s.end <= max_slot_time]
+        if logger.isEnabledFor(logging.INFO):
+            times_str = ", ".join(f"{t.start}-{t.end}" for t in activity_times)
+            logger.info(
+                f"[{name}] Found {len(activity_times)} activity times: {times_str}"
+            )
 
-        times_str = ", ".join(f"{t.start}-{t.end}" for t in activity_times)
-        logger.info(
-            f"[{name}] After filtering, got {len(activity_times)} activity times: {times_str}"
+        # Filter by time window (slot must start after min and end by max)
+        activity_times = filter_slots_by_time_window(
+            activity_times=activity_times,
+            min_time=booking.min_slot_time,
+            max_time=booking.max_slot_time,
         )
 
+        if logger.isEnabledFor(logging.INFO):
+            times_str = ", ".join(f"{t.start}-{t.end}" for t in activity_times)
+            logger.info(
+                f"[{name}] After filtering, got {len(activity_times)} activity times: {times_str}"
+            )
+
         # Find consecutive slots
         consecutive_slots = find_consecutive_slots(activity_times, booking.n_slots)
         if not consecutive_slots:
@@ -149,16 +156,13 @@ def book_activity_slots(
             f"{consecutive_slots[0].start} - {consecutive_slots[-1].end}"
         )
 
-        slots_to_book = []
-        for activity_time in consecutive_slots:
-            slots = client.get_available_slots_for(
-                venue=booking.venue,
-                activity=booking.activity,
-                activity_date=activity_date,
-                start_time=activity_time.start,
-                end_time=activity_time.end,
-            )
-            slots_to_book.append(slots[0])
+        slots_to_book = convert_times_to_slots(
+            client=client,
+            venue=booking.venue,
+            activity=booking.activity,
+            activity_date=activity_date,
+            activity_times=consecutive_slots,
+        )
 
         if slots_to_book:
             cart = client.add_to_cart(slots_to_book)
@@ -170,69 +174,97 @@ def book_activity_slots(
         raise
 
 
-def execute_single_attempt(
+def find_attempt_times(
     attempt,
     activity_date: datetime.date,
     attempt_number: int,
     total_attempts: int,
-) -> dict[str, any]:
+) -> list:
     """
-    Execute a single booking attempt.
+    Run the read-only phase of a booking attempt.
 
     Returns:
-        dict with keys:
-        - 'success' (bool)
-        - 'order_id' (str|None)
-        - 'error' (Exception|None)
-        - 'venue' (str|None) - only present if success=True
-        - 'activity' (str|None) - only present if success=True
-        - 'slots' (list|None) - ActivityTime objects, only present if success=True
+        The consecutive ActivityTime objects to book
+
+    Raises:
+        NotEnoughSlotsFound if the attempt has no matching consecutive slots
     """
     log_attempt_start(attempt_number, total_attempts, attempt)
 
-    try:
-        # Parse time window
-        min_time, max_time = parse_time_window(
-            attempt.min_slot_time, attempt.max_slot_time
-        )
+    # Authenticate and get client
+    client = get_client(username=attempt.username, password=attempt.password)
 
-        # Authenticate and get client
-        client = get_client(username=attempt.username, password=attempt.password)
-
-        # Fetch available times
+    # Fetch available times, looking up the membership user id needed at
+    # checkout in the background
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(lambda: client.membership_user_id)
         available_times = client.get_available_times_for(
             venue=attempt.venue,
             activity=attempt.activity,
             activity_date=activity_date,
         )
+    if logger.isEnabledFor(logging.INFO):
         times_str = ", ".join(f"{t.start}-{t.end}" for t in available_times)
         logger.info(
             f"Attempt {attempt_number}: Found {len(available_times)} times: {times_str}"
         )
 
-        # Filter by time window
-        filtered_times = filter_slots_by_time_window(
-            activity_times=available_times,
-            min_time=min_time,
-            max_time=max_time,
-        )
+    # Filter by time window
+    filtered_times = filter_slots_by_time_window(
+        activity_times=available_times,
+        min_time=attempt.min_slot_time,
+        max_time=attempt.max_slot_time,
+    )
+    if logger.isEnabledFor(logging.INFO):
         times_str = ", ".join(f"{t.start}-{t.end}" for t in filtered_times)
         logger.info(
             f"Attempt {attempt_number}: After filtering, {len(filtered_times)} times: {times_str}"
         )
 
-        # Find consecutive slots
-        consecutive = find_consecutive_slots(filtered_times, attempt.n_slots)
-        if not consecutive:
-            raise NotEnoughSlotsFound(
-                f"Could not find {attempt.n_slots} consecutive slots"
+    # Find consecutive slots
+    consecutive = find_consecutive_slots(filtered_times, attempt.n_slots)
+    if not consecutive:
+        raise NotEnoughSlotsFound(f"Could not find {attempt.n_slots} consecutive slots")
+    logger.info(
+        f"Attempt {attempt_number}: Found consecutive slots: "
+        f"{consecutive[0].start} - {consecutive[-1].end}"
+    )
+    return consecutive
+
+
+def execute_single_attempt(
+    attempt,
+    activity_date: datetime.date,
+    attempt_number: int,
+    total_attempts: int,
+    pending_times: Future | None = None,
+) -> dict[str, any]:
+    """
+    Execute a single booking attempt.
+
+    Args:
+        pending_times: Optional future of find_attempt_times already running
+            for this attempt; when omitted the read phase runs inline
+
+    Returns:
+        dict with keys:
+        - 'success' (bool)
+        - 'order_id' (str|None)
+        - 'error' (Exception|None)
+        - 'venue' (str|None) - only present if success=True
+        - 'activity' (str|None) - only present if success=True
+        - 'slots' (list|None) - ActivityTime objects, only present if success=True
+    """
+    try:
+        if pending_times is None:
+            consecutive = find_attempt_times(
+                attempt, activity_date, attempt_number, total_attempts
             )
-        logger.info(
-            f"Attempt {attempt_number}: Found consecutive slots: "
-            f"{consecutive[0].start} - {consecutive[-1].end}"
-        )
+        else:
+            consecutive = pending_times.result()
 
         # Convert to bookable slots and complete booking
+        client = get_client(username=attempt.username, password=attempt.password)
         slots = convert_times_to_slots(
             client=client,
             venue=attempt.venue,
@@ -279,31 +311,46 @@ def execute_booking_with_fallback(
     logger.info(f"[{job_name}] Starting booking with {len(attempts)} attempt(s)")
     all_errors = []
 
-    for idx, attempt in enumerate(attempts):
-        attempt_num = idx + 1
-        result = execute_single_attempt(
-            attempt=attempt,
-            activity_date=activity_date,
-            attempt_number=attempt_num,
-            total_attempts=len(attempts),
+    # The read-only phase of every attempt runs concurrently, so a slow attempt
+    # does not delay the next ones. Checkouts still happen one at a time, in
+    # order of preference.
+    executor = ThreadPoolExecutor(max_workers=len(attempts))
+    pending = [
+        executor.submit(
+            find_attempt_times, attempt, activity_date, idx + 1, len(attempts)
         )
+        for idx, attempt in enumerate(attempts)
+    ]
 
-        if result["success"]:
-            log_attempt_success(job_name, attempt_num, result["order_id"])
-            # Send success notification to Discord
-            send_success_notification(
-                webhook_url=discord_webhook_url,
-                job_name=job_name,
-                attempt_num=attempt_num,
-                order_id=result["order_id"],
-                venue=result["venue"],
-                activity=result["activity"],
-                slots=result["slots"],
+    try:
+        for idx, attempt in enumerate(attempts):
+            attempt_num = idx + 1
+            result = execute_single_attempt(
+                attempt=attempt,
+                activity_date=activity_date,
+                attempt_number=attempt_num,
+                total_attempts=len(attempts),
+                pending_times=pending[idx],
             )
-            return result["order_id"]
-        else:
-            log_attempt_failure(job_name, attempt_num, result["error"])
-            all_errors.append((idx, result["error"]))
+
+            if result["success"]:
+                log_attempt_success(job_name, attempt_num, result["order_id"])
+                # Send success notification to Discord
+                send_success_notification(
+                    webhook_url=discord_webhook_url,
+                    job_name=job_name,
+                    attempt_num=attempt_num,
+                    order_id=result["order_id"],
+                    venue=result["venue"],
+                    activity=result["activity"],
+                    slots=result["slots"],
+                )
+                return result["order_id"]
+            else:
+                log_attempt_failure(job_name, attempt_num, result["error"])
+                all_errors.append((idx, result["error"]))
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
 
     # All attempts failed
     logger.error(
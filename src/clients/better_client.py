@@ -1,14 +1,19 @@
 from __future__ import annotations
 
+import dataclasses
 import datetime
 import functools
+import hashlib
 import logging
+import threading
+import time
 from collections.abc import Callable
 from typing import Concatenate
 
 from pydantic import SecretStr
 from httpx_retries import RetryTransport, Retry
 import httpx
+import orjson
 from src.models import (
     ActivityCart,
     ActivitySlot,
@@ -32,50 +37,127 @@ def _requires_authentication[**P, R](
 ) -> _LiveBetterClientInstanceMethod[P, R]:
     @functools.wraps(func)
     def wrapper(self: LiveBetterClient, *args: P.args, **kwargs: P.kwargs) -> R:
-        if not self.authenticated:
-            logging.info(
-                "requires_authentication: client is not authenticated, will authenticate"
-            )
-            self.authenticate()
-        return func(self, *args, **kwargs)
+        self._ensure_authenticated()
+        authorization = self.client.headers.get("Authorization")
+        try:
+            return func(self, *args, **kwargs)
+        except httpx.HTTPStatusError as e:
+            if e.response.status_code != httpx.codes.UNAUTHORIZED:
+                raise
+            self._reauthenticate(rejected_authorization=authorization)
+            return func(self, *args, **kwargs)
 
     return wrapper
 
 
+def _parse_24_hour_time(value: str) -> datetime.time:
+    """Parse an "HH:MM" string, avoiding the overhead of strptime."""
+    hour, minute = value.split(":")
+    return datetime.time(int(hour), int(minute))
+
+
 class LiveBetterClient:
     HEADERS = {
         "Origin": "https://bookings.better.org.uk",
         "User-Agent": "Mozilla/5.0 (X11; Linux x86_64; rv:131.0) Gecko/20100101 Firefox/131.0",
     }
 
+    # Re-authenticate proactively rather than waiting for a stale token to be
+    # rejected mid-booking
+    AUTH_TTL_SECONDS = 30 * 60
+
+    # Availability changes quickly, so fetched times are only reused briefly
+    TIMES_CACHE_TTL_SECONDS = 10
+
     def __init__(self, username: str, password: SecretStr):
         self.username = username
         self.password = password
+        self._auth_lock = threading.Lock()
+        self._authenticated_at: float | None = None
+        self._membership_user_id: int | None = None
+        self._membership_user_id_lock = threading.Lock()
+        self._times_cache: dict[
+            tuple[str, str, datetime.date], tuple[float, list[ActivityTime]]
+        ] = {}
+        self._times_cache_lock = threading.Lock()
+        self._times_fetch_locks: dict[
+            tuple[str, str, datetime.date], threading.Lock
+        ] = {}
 
         retry = Retry(
             total=5,
             backoff_factor=1.0,
-            status_forcelist=[500, 502, 503, 504],
+            status_forcelist=[429, 500, 502, 503, 504],
             allowed_methods=["GET", "POST"],
         )
         self.client = httpx.Client(
             base_url="https://better-admin.org.uk/api/",
-            transport=RetryTransport(retry=retry),
+            transport=RetryTransport(
+                retry=retry,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    # Cap concurrent connections to the API host
+                    limits=httpx.Limits(
+                        max_connections=32,
+                        max_keepalive_connections=8,
+                        keepalive_expiry=60.0,
+                    ),
+                ),
+            ),
             timeout=30.0,
         )
         self.client.headers.update(self.HEADERS)
 
     @property
     def authenticated(self) -> bool:
-        return bool(self.client.headers.get("Authorization"))
+        return self._authenticated_for(0.0)
+
+    def _authenticated_for(self, seconds: float) -> bool:
+        """Whether the current token stays valid for at least `seconds`."""
+        if self._authenticated_at is None:
+            return False
+        if not self.client.headers.get("Authorization"):
+            return False
+        token_age = time.monotonic() + seconds - self._authenticated_at
+        return token_age < self.AUTH_TTL_SECONDS
+
+    def _ensure_authenticated(self) -> None:
+        if self.authenticated:
+            return
+        # Requests may be issued from several threads, only log in once
+        with self._auth_lock:
+            if not self.authenticated:
+                logging.info(
+                    "requires_authentication: client is not authenticated, will authenticate"
+                )
+                self.authenticate()
+
+    def _reauthenticate(self, rejected_authorization: str | None) -> None:
+        # Concurrent requests rejected with the same token only log in once
+        with self._auth_lock:
+            if self.client.headers.get("Authorization") != rejected_authorization:
+                return
+            logging.info(
+                "requires_authentication: token was rejected, will re-authenticate"
+            )
+            self.client.headers.pop("Authorization", None)
+            self.authenticate()
 
-    @functools.cached_property
-    @_requires_authentication
+    @property
     def membership_user_id(self) -> int:
+        if self._membership_user_id is None:
+            # Concurrent attempts on the same credentials share one lookup
+            with self._membership_user_id_lock:
+                if self._membership_user_id is None:
+                    self._membership_user_id = self._fetch_membership_user_id()
+        return self._membership_user_id
+
+    @_requires_authentication
+    def _fetch_membership_user_id(self) -> int:
         response = self.client.get("auth/user")
         response.raise_for_status()
 
-        return response.json()["data"]["membership_user"]["id"]
+        return orjson.loads(response.content)["data"]["membership_user"]["id"]
 
     def authenticate(self) -> None:
         logger.info(f"Authenticating user {self.username}...")
@@ -87,9 +169,24 @@ class LiveBetterClient:
         )
         auth_response.raise_for_status()
 
-        token: str = auth_response.json()["token"]
+        token: str = orjson.loads(auth_response.content)["token"]
+        # Other threads check authentication without the lock, so record the
+        # login time before exposing the token
+        self._authenticated_at = time.monotonic()
         self.client.headers.update({"Authorization": f"Bearer {token}"})
 
+    def prewarm(self, valid_for: float = 0.0) -> None:
+        """Open a connection to the API with a session that stays authenticated
+        for at least `valid_for` seconds."""
+        # Log in now rather than letting the token expire during the booking
+        with self._auth_lock:
+            if not self._authenticated_for(valid_for):
+                self.authenticate()
+        # Always fetch, even if cached, so the request opens the connection;
+        # the booking then finds the id it needs at checkout already cached
+        with self._membership_user_id_lock:
+            self._membership_user_id = self._fetch_membership_user_id()
+
     @_requires_authentication
     def get_available_slots_for(
         self,
@@ -102,9 +199,9 @@ class LiveBetterClient:
         response = self.client.get(
             f"activities/venue/{venue}/activity/{activity}/slots",
             params={
-                "date": activity_date.strftime("%Y-%m-%d"),
-                "start_time": start_time.strftime("%H:%M"),
-                "end_time": end_time.strftime("%H:%M"),
+                "date": activity_date.isoformat(),
+                "start_time": start_time.isoformat(timespec="minutes"),
+                "end_time": end_time.isoformat(timespec="minutes"),
             },
         )
         response.raise_for_status()
@@ -118,7 +215,7 @@ class LiveBetterClient:
                 name=slot["location"]["slug"],
                 cart_type=slot["cart_type"],
             )
-            for slot in response.json()["data"]
+            for slot in orjson.loads(response.content)["data"]
             if slot["spaces"] > 0 and slot["booking"] is None
             # and slot["benefit_available"] is not None
         ]
@@ -126,23 +223,55 @@ class LiveBetterClient:
     @_requires_authentication
     def get_available_times_for(
         self, venue: str, activity: str, activity_date: datetime.date
+    ) -> list[ActivityTime]:
+        # Fallback attempts and jobs firing together often target the same
+        # venue/activity/date, so briefly reuse the times already fetched
+        cache_key = (venue, activity, activity_date)
+        # Concurrent attempts for the same key wait for a single request
+        with self._times_cache_lock:
+            fetch_lock = self._times_fetch_locks.setdefault(cache_key, threading.Lock())
+        with fetch_lock:
+            cached = self._times_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+
+            activity_times = self._fetch_available_times_for(
+                venue=venue, activity=activity, activity_date=activity_date
+            )
+            now = time.monotonic()
+            with self._times_cache_lock:
+                self._prune_times_cache(now)
+                self._times_cache[cache_key] = (
+                    now + self.TIMES_CACHE_TTL_SECONDS,
+                    activity_times,
+                )
+            return activity_times
+
+    def _prune_times_cache(self, now: float) -> None:
+        # Called with _times_cache_lock held. The bot is long-running and every
+        # day brings new dates, so expired entries and idle fetch locks go
+        for key, (expires_at, _) in list(self._times_cache.items()):
+            if expires_at <= now:
+                del self._times_cache[key]
+        for key, fetch_lock in list(self._times_fetch_locks.items()):
+            if key not in self._times_cache and not fetch_lock.locked():
+                del self._times_fetch_locks[key]
+
+    def _fetch_available_times_for(
+        self, venue: str, activity: str, activity_date: datetime.date
     ) -> list[ActivityTime]:
         response = self.client.get(
             f"activities/venue/{venue}/activity/{activity}/times",
-            params={"date": activity_date.strftime("%Y-%m-%d")},
+            params={"date": activity_date.isoformat()},
         )
         response.raise_for_status()
 
-        data = response.json()["data"]
-        logger.info(data)
+        data = orjson.loads(response.content)["data"]
+        logger.debug("Activity times response: %s", data)
         return [
             ActivityTime(
-                start=datetime.datetime.strptime(
-                    time_["starts_at"]["format_24_hour"], "%H:%M"
-                ).time(),
-                end=datetime.datetime.strptime(
-                    time_["ends_at"]["format_24_hour"], "%H:%M"
-                ).time(),
+                start=_parse_24_hour_time(time_["starts_at"]["format_24_hour"]),
+                end=_parse_24_hour_time(time_["ends_at"]["format_24_hour"]),
                 name=time_["name"],
                 location=time_["location"],
                 spaces=time_["spaces"],
@@ -174,7 +303,7 @@ class LiveBetterClient:
         )
         response.raise_for_status()
 
-        data = response.json()["data"]
+        data = orjson.loads(response.content)["data"]
 
         return ActivityCart(
             id=data["id"],
@@ -182,23 +311,39 @@ class LiveBetterClient:
             source=data["source"],
         )
 
-    @_requires_authentication
     def checkout_with_benefit(self, cart: ActivityCart) -> int:
+        # Each step is retried on its own after a rejected token, so credits
+        # are never applied twice
         # When need to use credit
         if cart.amount:
-            apply_credits_response = self.client.post(
-                "credits/apply",
-                json={
-                    "credits_to_reserve": [{"amount": cart.amount, "type": "general"}],
-                    "cart_source": cart.source,
-                    "selected_user_id": None,
-                },
-            )
-            apply_credits_response.raise_for_status()
+            self._apply_credits(cart)
             payments = [{"tender_type": "credit", "amount": cart.amount}]
         else:
             payments = []
 
+        order_id = self._complete_checkout(cart, payments)
+
+        # Availability has changed, cached times are no longer accurate
+        with self._times_cache_lock:
+            self._times_cache.clear()
+            self._prune_times_cache(time.monotonic())
+
+        return order_id
+
+    @_requires_authentication
+    def _apply_credits(self, cart: ActivityCart) -> None:
+        apply_credits_response = self.client.post(
+            "credits/apply",
+            json={
+                "credits_to_reserve": [{"amount": cart.amount, "type": "general"}],
+                "cart_source": cart.source,
+                "selected_user_id": None,
+            },
+        )
+        apply_credits_response.raise_for_status()
+
+    @_requires_authentication
+    def _complete_checkout(self, cart: ActivityCart, payments: list[dict]) -> int:
         complete_checkout_response = self.client.post(
             "checkout/complete",
             json=dict(
@@ -211,7 +356,7 @@ class LiveBetterClient:
         )
         complete_checkout_response.raise_for_status()
 
-        return complete_checkout_response.json()["complete_order_id"]
+        return orjson.loads(complete_checkout_response.content)["complete_order_id"]
 
     @_requires_authentication
     def get_my_bookings(self, filter: str = "future") -> list[Booking]:
@@ -230,10 +375,38 @@ class LiveBetterClient:
         )
         response.raise_for_status()
 
-        data = response.json()["data"]
+        data = orjson.loads(response.content)["data"]
         return [Booking(**booking) for booking in data]
 
 
+@dataclasses.dataclass(slots=True, frozen=True)
+class CredentialsKey:
+    """Identify a credential pair without keeping the plaintext password."""
+
+    username: str
+    password_hash: str
+
+
+_clients: dict[CredentialsKey, LiveBetterClient] = {}
+_clients_lock = threading.Lock()
+
+
+def credentials_key(username: str, password: SecretStr) -> CredentialsKey:
+    """Build the key identifying a credential pair."""
+    password_hash = hashlib.sha256(password.get_secret_value().encode()).hexdigest()
+    return CredentialsKey(username=username, password_hash=password_hash)
+
+
 def get_client(username: str, password: SecretStr) -> LiveBetterClient:
-    """Get client with credentials."""
-    return LiveBetterClient(username=username, password=password)
+    """Get client with credentials.
+
+    Clients are cached per credentials so the authenticated session (token and
+    membership user id) is reused across booking attempts.
+    """
+    key = credentials_key(username, password)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = LiveBetterClient(username=username, password=password)
+            _clients[key] = client
+    return client
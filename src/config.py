@@ -1,9 +1,29 @@
+import datetime
 import os
 import re
 from pathlib import Path
 
 import yaml
-from pydantic import BaseModel, Field, SecretStr
+from pydantic import BaseModel, Field, SecretStr, field_validator
+
+ENV_VAR_PATTERN = re.compile(r"<([A-Z_][A-Z0-9_]*)>")
+
+# Prefer the libyaml-backed loader when PyYAML was built with it
+YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def parse_slot_time(value) -> datetime.time:
+    """Parse a slot time, which must be a quoted "HH:MM[:SS]" string.
+
+    Unquoted YAML times such as 18:00:00 load as base-60 integers, which
+    Pydantic would otherwise turn into a wrong or timezone-aware time.
+    """
+    if not isinstance(value, str):
+        raise ValueError(f'must be a quoted time such as "18:00:00", got {value!r}')
+    slot_time = datetime.time.fromisoformat(value)
+    if slot_time.tzinfo is not None:
+        raise ValueError(f"must not include a timezone, got {value!r}")
+    return slot_time
 
 
 class DiscordBotConfig(BaseModel):
@@ -19,12 +39,19 @@ class BookingAttempt(BaseModel):
     password: SecretStr = Field(description="Better account password")
     venue: str = Field(description="Venue slug")
     activity: str = Field(description="Activity slug")
-    min_slot_time: str = Field(description="Minimum slot time (HH:MM:SS)")
-    max_slot_time: str | None = Field(
+    min_slot_time: datetime.time = Field(description="Minimum slot time (HH:MM:SS)")
+    max_slot_time: datetime.time | None = Field(
         default=None, description="Maximum slot time (HH:MM:SS)"
     )
     n_slots: int = Field(default=1, description="Number of consecutive slots to book")
 
+    @field_validator("min_slot_time", "max_slot_time", mode="before")
+    @classmethod
+    def parse_slot_times(cls, v):
+        if v is None:
+            return v
+        return parse_slot_time(v)
+
 
 class BookingConfig(BaseModel):
     """Config to book one activity."""
@@ -33,12 +60,19 @@ class BookingConfig(BaseModel):
     password: SecretStr = Field(description="Better account password")
     venue: str = Field(description="Venue slug")
     activity: str = Field(description="Activity slug")
-    min_slot_time: str = Field(description="Minimum slot time (HH:MM:SS)")
-    max_slot_time: str | None = Field(
+    min_slot_time: datetime.time = Field(description="Minimum slot time (HH:MM:SS)")
+    max_slot_time: datetime.time | None = Field(
         default=None, description="Maximum slot time (HH:MM:SS)"
     )
     n_slots: int = Field(default=1, description="Number of consecutive slots to book")
 
+    @field_validator("min_slot_time", "max_slot_time", mode="before")
+    @classmethod
+    def parse_slot_times(cls, v):
+        if v is None:
+            return v
+        return parse_slot_time(v)
+
 
 class ScheduledBookingConfig(BaseModel):
     """Config for a scheduled booking job with multiple fallback attempts."""
@@ -65,7 +99,8 @@ class AppConfig(BaseModel):
 
 def substitute_env_vars(value: str) -> str:
     """Substitute <ENV_VAR> patterns with environment variable values."""
-    pattern = r"<([A-Z_][A-Z0-9_]*)>"
+    if "<" not in value:
+        return value
 
     def replace(match: re.Match) -> str:
         env_var = match.group(1)
@@ -74,17 +109,35 @@ def substitute_env_vars(value: str) -> str:
             raise ValueError(f"Environment variable {env_var} is not set")
         return env_value
 
-    return re.sub(pattern, replace, value)
+    return ENV_VAR_PATTERN.sub(replace, value)
 
 
 def process_config_values(obj):
-    """Recursively process config values to substitute environment variables."""
-    if isinstance(obj, dict):
-        return {k: process_config_values(v) for k, v in obj.items()}
-    elif isinstance(obj, list):
-        return [process_config_values(item) for item in obj]
-    elif isinstance(obj, str):
+    """Substitute environment variables in config values, in place.
+
+    Containers are walked with an explicit stack and only string values that
+    actually change are reassigned. Returns the (possibly replaced) object.
+    """
+    if isinstance(obj, str):
         return substitute_env_vars(obj)
+
+    stack = [obj]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            items = container.items()
+        elif isinstance(container, list):
+            items = enumerate(container)
+        else:
+            continue
+
+        for key, value in list(items):
+            if isinstance(value, str):
+                substituted = substitute_env_vars(value)
+                if substituted is not value:
+                    container[key] = substituted
+            elif isinstance(value, (dict, list)):
+                stack.append(value)
     return obj
 
 
@@ -96,7 +149,7 @@ def load_config(config_path: Path | str = "config.yaml") -> AppConfig:
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
     with open(config_path) as f:
-        raw_config = yaml.safe_load(f)
+        raw_config = yaml.load(f, Loader=YamlLoader)
 
     # Process environment variable substitution
     processed_config = process_config_values(raw_config)
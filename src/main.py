@@ -1,23 +1,34 @@
 import asyncio
+import atexit
 import datetime
-import json
+import functools
 import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
 from zoneinfo import ZoneInfo
 
 import discord
 import yaml
+from apscheduler.executors.pool import ThreadPoolExecutor
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 from discord import app_commands
 from dotenv import load_dotenv
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
 from src.clients.better_client import get_client
 from src.config import (
     AppConfig,
     load_config,
 )
 from src.scripts.scheduled_booking import (
+    LeadTrigger,
     parse_cron_expression,
+    prewarm_clients,
     run_scheduled_booking,
     validate_credentials,
 )
@@ -32,11 +43,36 @@ logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
 )
 
+# Write log records to stderr from a background thread, so booking jobs do not
+# block on console I/O between their HTTP requests
+log_queue = queue.SimpleQueue()
+root_logger = logging.getLogger()
+log_listener = QueueListener(
+    log_queue, *root_logger.handlers, respect_handler_level=True
+)
+root_logger.handlers = [QueueHandler(log_queue)]
+log_listener.start()
+atexit.register(log_listener.stop)
+
 # Load application configuration
 config: AppConfig = load_config()
 
-# Initialize scheduler
-scheduler = AsyncIOScheduler()
+# Prefer the libyaml-backed dumper when PyYAML was built with it
+YamlDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
+# Timezone the booking schedules are expressed in
+LONDON_TZ = ZoneInfo("Europe/London")
+
+# How long before a booking job its clients are pre-warmed
+PREWARM_LEAD = datetime.timedelta(seconds=30)
+
+# Initialize scheduler. Booking jobs are blocking, so run them on a thread pool
+# large enough for every job to fire at once, and tolerate short start delays
+# rather than skipping a booking window.
+scheduler = AsyncIOScheduler(
+    executors={"default": ThreadPoolExecutor(max_workers=max(4, len(config.bookings)))},
+    job_defaults={"coalesce": False, "max_instances": 1, "misfire_grace_time": 30},
+)
 
 # Setup Discord bot
 intents = discord.Intents.default()
@@ -61,7 +97,8 @@ async def list_bookings(interaction: discord.Interaction):
             username=first_booking_attempt.username,
             password=first_booking_attempt.password,
         )
-        bookings = better_client.get_my_bookings()
+        # Run the blocking HTTP call in a thread to keep the event loop responsive
+        bookings = await asyncio.to_thread(better_client.get_my_bookings)
 
         if not bookings:
             await interaction.followup.send("You have no upcoming bookings.")
@@ -108,27 +145,36 @@ async def list_jobs(interaction: discord.Interaction):
     """Slash command to list scheduled jobs."""
     await interaction.response.defer(ephemeral=True)
     try:
-        jobs = scheduler.get_jobs()
+        # Pre-warm jobs are an implementation detail of each booking job
+        jobs = [job for job in scheduler.get_jobs() if job.func is not prewarm_clients]
         if not jobs:
             await interaction.followup.send("There are no scheduled jobs.")
             return
 
-        embed = discord.Embed(
-            title="Scheduled Jobs",
-            color=discord.Color.green(),
-        )
-        for job in jobs:
-            next_run = (
+        lines = [
+            f"**{job.name}**\n**Next Run:** "
+            + (
                 job.next_run_time.strftime("%Y-%m-%d %H:%M:%S %Z")
                 if job.next_run_time
                 else "N/A"
             )
-            embed.add_field(
-                name=job.name,
-                value=f"**Next Run:** {next_run}",
-                inline=False,
+            for job in jobs
+        ]
+
+        description = "\n\n".join(lines)
+
+        # Discord has a 4096 character limit per embed description
+        if len(description) > 4096:
+            await interaction.followup.send(
+                f"There are {len(jobs)} scheduled jobs, but the list is too large to display."
+            )
+        else:
+            embed = discord.Embed(
+                title="Scheduled Jobs",
+                description=description,
+                color=discord.Color.green(),
             )
-        await interaction.followup.send(embed=embed)
+            await interaction.followup.send(embed=embed)
 
     except Exception as e:
         logger.error(f"Error listing jobs: {e}", exc_info=True)
@@ -137,17 +183,25 @@ async def list_jobs(interaction: discord.Interaction):
         )
 
 
+@functools.cache
+def render_config_yaml() -> str:
+    """Render the loaded configuration as YAML, with secrets redacted.
+
+    The configuration does not change after startup, so this is computed once.
+    """
+    # Dump Pydantic model in JSON mode, which redacts SecretStr fields
+    config_dict = config.model_dump(mode="json")
+
+    # Convert dictionary to YAML
+    return yaml.dump(config_dict, Dumper=YamlDumper, indent=2, default_flow_style=False)
+
+
 @tree.command(name="get-config", description="Display the application configuration")
 async def get_config(interaction: discord.Interaction):
     """Slash command to display the current application configuration."""
     await interaction.response.defer(ephemeral=True)
     try:
-        # Dump Pydantic model to JSON, which redacts SecretStr fields
-        config_json = config.model_dump_json(indent=2)
-        config_dict = json.loads(config_json)
-
-        # Convert dictionary to YAML
-        config_yaml = yaml.dump(config_dict, indent=2, default_flow_style=False)
+        config_yaml = render_config_yaml()
 
         # Send as a formatted code block
         message = f"```yaml\n{config_yaml}\n```"
@@ -174,22 +228,35 @@ def start_scheduler(app_config: AppConfig):
         logger.warning("No bookings configured. Scheduler will not be started.")
         return
 
-    # Validate credentials before starting scheduler
-    validate_credentials(app_config.bookings)
-
+    scheduled_jobs = []
     for booking in app_config.bookings:
         cron_kwargs = parse_cron_expression(booking.schedule)
-        trigger = CronTrigger(**cron_kwargs, timezone="Europe/London")
+        trigger = CronTrigger(**cron_kwargs, timezone=LONDON_TZ)
 
-        scheduler.add_job(
+        job = scheduler.add_job(
             run_scheduled_booking,
             trigger=trigger,
             args=[booking],
             id=booking.name,
             name=booking.name,
         )
-        now = datetime.datetime.now(ZoneInfo("Europe/London"))
-        next_run = trigger.get_next_fire_time(None, now)
+        scheduled_jobs.append((job, booking))
+
+        # Authenticate and open connections shortly before each run, so the
+        # booking itself starts on a warm, freshly authenticated session
+        scheduler.add_job(
+            prewarm_clients,
+            trigger=LeadTrigger(trigger, PREWARM_LEAD),
+            args=[booking, PREWARM_LEAD],
+            id=f"{booking.name} (pre-warm)",
+            name=f"{booking.name} (pre-warm)",
+        )
+
+    scheduler.start()
+
+    # The scheduler computes each job's next run time when it starts
+    for job, booking in scheduled_jobs:
+        next_run = job.next_run_time
         booking_date = (
             next_run.date() if next_run else datetime.date.today()
         ) + datetime.timedelta(days=booking.days_ahead)
@@ -197,16 +264,48 @@ def start_scheduler(app_config: AppConfig):
             f"Scheduled job: {booking.name} (next run: {next_run}, booking for: {booking_date})"
         )
 
-    scheduler.start()
-    logger.info(f"Scheduler started with {len(app_config.bookings)} job(s).")
+    logger.info(
+        f"Scheduler started with {len(scheduler.get_jobs())} job(s): "
+        f"{len(scheduled_jobs)} booking(s), each with a pre-warm job."
+    )
+
+
+async def sync_commands() -> bool:
+    """Sync slash commands with Discord. Returns whether the sync succeeded."""
+    try:
+        await tree.sync()
+        logger.info("Discord commands are synced.")
+        return True
+    except Exception as e:
+        logger.error(f"Error syncing commands: {e}", exc_info=True)
+        return False
+
+
+# Keep a reference to the background sync so it is not garbage collected
+command_sync_task: asyncio.Task | None = None
 
 
 @client.event
 async def on_ready():
     """Event handler for when the bot is ready."""
-    await tree.sync()
+    global command_sync_task
+
     logger.info(f"Logged in as {client.user}")
-    logger.info("Discord bot is ready and commands are synced.")
+    # on_ready fires again on reconnects; commands only need syncing once, so
+    # only a sync that failed is started again
+    if command_sync_task is None or (
+        command_sync_task.done() and not command_sync_task.result()
+    ):
+        command_sync_task = asyncio.create_task(sync_commands())
+    logger.info("Discord bot is ready.")
+
+
+async def setup_scheduler(app_config: AppConfig):
+    """Validate credentials, then add jobs to the scheduler and start it."""
+    # Validate credentials before starting scheduler, off the event loop so the
+    # Discord bot can log in meanwhile
+    await asyncio.to_thread(validate_credentials, app_config.bookings)
+    start_scheduler(app_config)
 
 
 async def main():
@@ -214,13 +313,12 @@ async def main():
     if not config.discord_bot:
         raise ValueError("Discord bot configuration is missing.")
 
-    # Initialize and start the scheduler
-    start_scheduler(config)
-
-    # Start the Discord bot
+    # Start the scheduler and the Discord bot concurrently. Leaving the context
+    # closes the bot, including when credential validation fails.
     token = config.discord_bot.token.get_secret_value()
-    await client.start(token)
+    async with client:
+        await asyncio.gather(client.start(token), setup_scheduler(config))
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(main(), loop_factory=uvloop.new_event_loop if uvloop else None)
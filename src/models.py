@@ -1,8 +1,13 @@
 import datetime
+from dataclasses import dataclass
+
 from pydantic import BaseModel, field_validator
 
 
-class ActivitySlot(BaseModel):
+# Slots, times and carts are built by the client from already well-formed API
+# responses, so they are plain slotted dataclasses rather than Pydantic models.
+@dataclass(slots=True, frozen=True)
+class ActivitySlot:
     id: int
     location_id: int
     pricing_option_id: int
@@ -11,7 +16,8 @@ class ActivitySlot(BaseModel):
     cart_type: str
 
 
-class ActivityTime(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ActivityTime:
     start: datetime.time
     end: datetime.time
     name: str
@@ -21,7 +27,8 @@ class ActivityTime(BaseModel):
     duration: str
 
 
-class ActivityCart(BaseModel):
+@dataclass(slots=True, frozen=True)
+class ActivityCart:
     id: int
     amount: int
     source: str
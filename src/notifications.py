@@ -4,9 +4,13 @@ import datetime
 import logging
 
 import httpx
+import orjson
 
 logger = logging.getLogger(__name__)
 
+# Shared client so consecutive webhook posts reuse the same connection
+_webhook_client = httpx.Client(timeout=10.0)
+
 
 def send_discord_notification(webhook_url: str, message: str, color: int) -> None:
     """
@@ -29,7 +33,11 @@ def send_discord_notification(webhook_url: str, message: str, color: int) -> Non
 
         payload = {"embeds": [embed]}
 
-        response = httpx.post(webhook_url, json=payload, timeout=10.0)
+        response = _webhook_client.post(
+            webhook_url,
+            content=orjson.dumps(payload),
+            headers={"Content-Type": "application/json"},
+        )
         response.raise_for_status()
         logger.info("Discord notification sent successfully")
 
@@ -1,9 +1,15 @@
 import datetime
+import functools
 import logging
+import re
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
+from apscheduler.triggers.base import BaseTrigger
 
 from src.booking import execute_booking_with_fallback
-from src.clients.better_client import get_client
-from src.config import ScheduledBookingConfig
+from src.clients.better_client import credentials_key, get_client
+from src.config import BookingAttempt, ScheduledBookingConfig
 
 logger = logging.getLogger(__name__)
 logging.basicConfig(
@@ -30,61 +36,153 @@ def run_scheduled_booking(scheduled: ScheduledBookingConfig) -> None:
     )
 
 
+def unique_credential_attempts(
+    attempts: Iterable[BookingAttempt],
+) -> list[BookingAttempt]:
+    """Return the first attempt for each distinct credential pair."""
+    unique_attempts = {}
+    for attempt in attempts:
+        key = credentials_key(attempt.username, attempt.password)
+        unique_attempts.setdefault(key, attempt)
+    return list(unique_attempts.values())
+
+
+# How long a pre-warmed session must outlast the booking job's start, so the
+# booking itself never has to log in
+BOOKING_RUN_ALLOWANCE = datetime.timedelta(minutes=5)
+
+
+def prewarm_clients(
+    scheduled: ScheduledBookingConfig, lead: datetime.timedelta
+) -> None:
+    """Authenticate and connect the clients a scheduled booking will use.
+
+    `lead` is how long before the booking job this runs.
+    """
+    valid_for = (lead + BOOKING_RUN_ALLOWANCE).total_seconds()
+    for attempt in unique_credential_attempts(scheduled.attempts):
+        logger.info(f"[{scheduled.name}] Pre-warming client for {attempt.username}")
+        client = get_client(username=attempt.username, password=attempt.password)
+        client.prewarm(valid_for=valid_for)
+
+
+class LeadTrigger(BaseTrigger):
+    """Fire a fixed amount of time before each fire time of another trigger."""
+
+    def __init__(self, trigger: BaseTrigger, lead: datetime.timedelta):
+        self.trigger = trigger
+        self.lead = lead
+
+    def get_next_fire_time(self, previous_fire_time, now):
+        previous = previous_fire_time + self.lead if previous_fire_time else None
+        fire_time = self.trigger.get_next_fire_time(previous, now + self.lead)
+        if previous is None:
+            # When the job is added less than `lead` before a run, that run's
+            # pre-warm is skipped; firing it late would make APScheduler compute
+            # the same run again. Credentials were just validated at startup.
+            upcoming = self.trigger.get_next_fire_time(None, now)
+            if upcoming and (fire_time is None or upcoming < fire_time):
+                logger.warning(
+                    f"Run at {upcoming} is less than {self.lead} away, "
+                    "skipping its pre-warm"
+                )
+        return fire_time - self.lead if fire_time else None
+
+    def __str__(self):
+        return f"{self.trigger} - {self.lead}"
+
+
 def validate_credentials(bookings: list[ScheduledBookingConfig]) -> None:
-    """Validate all unique credential pairs across all booking attempts."""
-    seen = set()
-    for booking in bookings:
-        for attempt in booking.attempts:
-            key = (attempt.username, attempt.password.get_secret_value())
-            if key in seen:
-                continue
-            seen.add(key)
-
-            logger.info(f"Validating credentials for {attempt.username}...")
-            client = get_client(
-                username=attempt.username,
-                password=attempt.password,  # Pass SecretStr directly
-            )
-            client.authenticate()
-            logger.info(f"✓ Credentials valid for {attempt.username}")
+    """Validate all unique credential pairs across all booking attempts.
+
+    Logins run concurrently; every failure is logged and the first one is
+    raised once all of them have completed.
+    """
+    unique_attempts = unique_credential_attempts(
+        attempt for booking in bookings for attempt in booking.attempts
+    )
+
+    def validate(attempt) -> None:
+        logger.info(f"Validating credentials for {attempt.username}...")
+        client = get_client(
+            username=attempt.username,
+            password=attempt.password,  # Pass SecretStr directly
+        )
+        client.authenticate()
+        logger.info(f"✓ Credentials valid for {attempt.username}")
+
+    if not unique_attempts:
+        return
+
+    with ThreadPoolExecutor(max_workers=len(unique_attempts)) as executor:
+        futures = {
+            executor.submit(validate, attempt): attempt for attempt in unique_attempts
+        }
+    errors = []
+    for future, attempt in futures.items():
+        error = future.exception()
+        if error is not None:
+            logger.error(f"✗ Credentials invalid for {attempt.username}: {error}")
+            errors.append(error)
+    if errors:
+        raise errors[0]
+
+
+# Five whitespace-separated cron fields, tokenised and validated in one match
+CRON_FIELDS_PATTERN = re.compile(r"\s*(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s+(\S+)\s*")
+
+# Map cron DOW (0-7, Sun-Sun) to APScheduler (0-6, Mon-Sun), digit by digit
+CRON_TO_APS_DOW = str.maketrans("01234567", "60123456")
 
 
+def _expand_cron_dow_step(item: str) -> str:
+    """Expand a stepped cron day-of-week item ("*/2", "1-5/2") into a list."""
+    days, _, step = item.partition("/")
+    if days == "*":
+        first, last = 0, 6
+    else:
+        first, _, last = days.partition("-")
+        # "N/step" runs from N to the end of the week
+        first, last = int(first), int(last) if last else 6
+    return ",".join(str(day) for day in range(first, last + 1, int(step)))
+
+
+@functools.lru_cache(maxsize=128)
 def convert_cron_dow_to_apscheduler(dow: str) -> str:
     """Convert standard cron day-of-week to APScheduler format.
 
     Standard cron: 0=Sun, 1=Mon, ..., 6=Sat
     APScheduler:   0=Mon, 1=Tue, ..., 6=Sun
     """
-    # Map cron DOW (0-6, Sun-Sat) to APScheduler (0-6, Mon-Sun)
-    cron_to_aps = {0: 6, 1: 0, 2: 1, 3: 2, 4: 3, 5: 4, 6: 5, 7: 6}
-
-    def convert_single(val: str) -> str:
-        if val == "*":
-            return val
-        return str(cron_to_aps[int(val)])
-
-    # Handle ranges like "1-5"
-    if "-" in dow:
-        start, end = dow.split("-")
-        return f"{convert_single(start)}-{convert_single(end)}"
-    # Handle lists like "1,3,5"
-    elif "," in dow:
-        return ",".join(convert_single(v) for v in dow.split(","))
-    else:
-        return convert_single(dow)
+    # Steps count from cron's Sunday-based numbering, so expand them into
+    # explicit days before converting
+    if "/" in dow:
+        dow = ",".join(
+            _expand_cron_dow_step(item) if "/" in item else item
+            for item in dow.split(",")
+        )
+    # Day values are single digits, so ranges like "1-5" and lists like
+    # "1,3,5" convert in one pass
+    return dow.translate(CRON_TO_APS_DOW)
 
 
 def parse_cron_expression(cron_expr: str) -> dict:
     """Parse a cron expression into APScheduler CronTrigger kwargs."""
-    parts = cron_expr.split()
-    if len(parts) != 5:
+    # Return a fresh dict so callers cannot mutate the cached fields
+    return dict(_parse_cron_fields(cron_expr))
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_cron_fields(cron_expr: str) -> tuple[tuple[str, str], ...]:
+    match = CRON_FIELDS_PATTERN.fullmatch(cron_expr)
+    if not match:
         raise ValueError(f"Invalid cron expression: {cron_expr}")
 
-    minute, hour, day, month, day_of_week = parts
-    return {
-        "minute": minute,
-        "hour": hour,
-        "day": day,
-        "month": month,
-        "day_of_week": convert_cron_dow_to_apscheduler(day_of_week),
-    }
+    minute, hour, day, month, day_of_week = match.groups()
+    return (
+        ("minute", minute),
+        ("hour", hour),
+        ("day", day),
+        ("month", month),
+        ("day_of_week", convert_cron_dow_to_apscheduler(day_of_week)),
+    )
@@ -0,0 +1,72 @@
+import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from src.config import BookingAttempt, load_config
+
+CONFIG_TEMPLATE = """
+bookings:
+  - name: "Weekday evening"
+    schedule: "0 22 * * 1-5"
+    attempts:
+      - username: user
+        password: secret
+        venue: venue
+        activity: activity
+        min_slot_time: {min_slot_time}
+        max_slot_time: {max_slot_time}
+"""
+
+
+def write_config(tmp_path, min_slot_time, max_slot_time):
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(
+        CONFIG_TEMPLATE.format(min_slot_time=min_slot_time, max_slot_time=max_slot_time)
+    )
+    return config_path
+
+
+def test_load_config_parses_quoted_slot_times(tmp_path):
+    config = load_config(write_config(tmp_path, '"17:00:00"', '"21:00"'))
+    attempt = config.bookings[0].attempts[0]
+    assert attempt.min_slot_time == datetime.time(17, 0)
+    assert attempt.max_slot_time == datetime.time(21, 0)
+
+
+@pytest.mark.parametrize(
+    ("min_slot_time", "max_slot_time"),
+    [
+        # YAML 1.1 reads unquoted times as base-60 integers
+        ("18:00:00", '"21:00:00"'),
+        ('"17:00:00"', "21:00"),
+    ],
+)
+def test_load_config_rejects_unquoted_slot_times(
+    tmp_path, min_slot_time, max_slot_time
+):
+    with pytest.raises(ValidationError):
+        load_config(write_config(tmp_path, min_slot_time, max_slot_time))
+
+
+@pytest.mark.parametrize("slot_time", ["18:00:00+01:00", "6pm", "25:00"])
+def test_slot_time_rejects_invalid_strings(slot_time):
+    with pytest.raises(ValidationError):
+        BookingAttempt(
+            username="user",
+            password="secret",
+            venue="venue",
+            activity="activity",
+            min_slot_time=slot_time,
+        )
+
+
+def test_max_slot_time_is_optional():
+    attempt = BookingAttempt(
+        username="user",
+        password="secret",
+        venue="venue",
+        activity="activity",
+        min_slot_time="17:00",
+    )
+    assert attempt.max_slot_time is None
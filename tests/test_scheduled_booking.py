@@ -0,0 +1,106 @@
+import datetime
+import logging
+
+import pytest
+from apscheduler.triggers.cron import CronTrigger
+
+from src.scripts.scheduled_booking import (
+    LeadTrigger,
+    convert_cron_dow_to_apscheduler,
+    parse_cron_expression,
+)
+
+
+@pytest.mark.parametrize(
+    ("cron_dow", "expected"),
+    [
+        ("*", "*"),
+        ("7", "6"),
+        ("1-5", "0-4"),
+        ("1,3,5", "0,2,4"),
+        ("*/2", "6,1,3,5"),
+        ("1-5/2", "0,2,4"),
+        ("0/3", "6,2,5"),
+        ("1/2,0", "0,2,4,6"),
+    ],
+)
+def test_convert_cron_dow_to_apscheduler(cron_dow, expected):
+    assert convert_cron_dow_to_apscheduler(cron_dow) == expected
+
+
+@pytest.mark.parametrize(
+    ("cron_dow", "expected_weekdays"),
+    [
+        # Python weekdays: 0=Mon, ..., 6=Sun
+        ("*/2", {6, 1, 3, 5}),
+        ("1-5", {0, 1, 2, 3, 4}),
+        ("1,3,5", {0, 2, 4}),
+        ("7", {6}),
+    ],
+)
+def test_cron_dow_fires_on_cron_days(cron_dow, expected_weekdays):
+    trigger = CronTrigger(
+        **parse_cron_expression(f"0 22 * * {cron_dow}"),
+        timezone=datetime.timezone.utc,
+    )
+    now = datetime.datetime(2026, 1, 5, tzinfo=datetime.timezone.utc)
+    fire_days = set()
+    fire_time = None
+    for _ in range(7):
+        fire_time = trigger.get_next_fire_time(fire_time, now)
+        now = fire_time + datetime.timedelta(seconds=1)
+        fire_days.add(fire_time.weekday())
+    assert fire_days == expected_weekdays
+
+
+@pytest.mark.parametrize("cron_dow", ["*/0", "mon/2", "1-x/2"])
+def test_convert_cron_dow_rejects_invalid_steps(cron_dow):
+    with pytest.raises(ValueError):
+        convert_cron_dow_to_apscheduler(cron_dow)
+
+
+def test_parse_cron_expression_rejects_wrong_field_count():
+    with pytest.raises(ValueError):
+        parse_cron_expression("0 22 * *")
+
+
+def make_lead_trigger(cron_expr: str) -> LeadTrigger:
+    trigger = CronTrigger(
+        **parse_cron_expression(cron_expr), timezone=datetime.timezone.utc
+    )
+    return LeadTrigger(trigger, datetime.timedelta(seconds=30))
+
+
+def utc(*args) -> datetime.datetime:
+    return datetime.datetime(*args, tzinfo=datetime.timezone.utc)
+
+
+def test_lead_trigger_fires_lead_before_cron():
+    trigger = make_lead_trigger("0 22 * * *")
+    fire_time = trigger.get_next_fire_time(None, utc(2026, 1, 5, 12, 0))
+    assert fire_time == utc(2026, 1, 5, 21, 59, 30)
+
+
+def test_lead_trigger_advances_from_previous_fire_time():
+    # Cron 1-5 is Monday to Friday; 2026-01-09 is a Friday
+    trigger = make_lead_trigger("0 22 * * 1-5")
+    previous = utc(2026, 1, 9, 21, 59, 30)
+    fire_time = trigger.get_next_fire_time(
+        previous, previous + datetime.timedelta(seconds=1)
+    )
+    assert fire_time == utc(2026, 1, 12, 21, 59, 30)
+
+
+def test_lead_trigger_skips_run_less_than_lead_away(caplog):
+    trigger = make_lead_trigger("0 22 * * *")
+    with caplog.at_level(logging.WARNING):
+        fire_time = trigger.get_next_fire_time(None, utc(2026, 1, 5, 21, 59, 45))
+    assert fire_time == utc(2026, 1, 6, 21, 59, 30)
+    assert "skipping its pre-warm" in caplog.text
+
+
+def test_lead_trigger_does_not_warn_when_on_time(caplog):
+    trigger = make_lead_trigger("0 22 * * *")
+    with caplog.at_level(logging.WARNING):
+        trigger.get_next_fire_time(None, utc(2026, 1, 5, 21, 59, 0))
+    assert "skipping its pre-warm" not in caplog.text